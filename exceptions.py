@@ -1,18 +1,28 @@
 class NoConnectionToAPIError(Exception):
     """Проблема с подключением к API."""
 
+    __slots__ = ()
+
 
 class HwHaveNoStatusError(Exception):
     """Домашняя работа без статуса."""
 
+    __slots__ = ()
+
 
 class HwHaveNoNameError(Exception):
     """В овтете API нет ключа 'homework_name'."""
 
+    __slots__ = ()
+
 
 class SendMessageError(Exception):
     """Ошибка отправки сообщения в Telegram."""
 
+    __slots__ = ()
+
 
 class JsonDecodeError(Exception):
     """Ошибка преобразования к типу данных Python."""
+
+    __slots__ = ()
@@ -1,9 +1,12 @@
 import json
 import logging
 import os
+import queue
 import sys
 import time
 from http import HTTPStatus
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict
 
 import requests
 import telegram
@@ -28,16 +31,20 @@ formatter = logging.Formatter(
 )
 console_handler.setFormatter(formatter)
 file_handler.setFormatter(formatter)
-logger.addHandler(console_handler)
-logger.addHandler(file_handler)
+file_handler.setLevel(logging.INFO)
+log_queue = queue.SimpleQueue()
+queue_handler = QueueHandler(log_queue)
+log_listener = QueueListener(log_queue, console_handler, file_handler)
 
 PRACTICUM_TOKEN = os.getenv('PRACTICUM_TOKEN')
 TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
 TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
 
 RETRY_PERIOD = 600
+MAX_RETRY_PERIOD = 3600
 ENDPOINT = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
 HEADERS = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
+REQUEST_TIMEOUT = (5, 30)
 
 HOMEWORK_VERDICTS = {
     'approved': 'Работа проверена: ревьюеру всё понравилось. Ура!',
@@ -57,44 +64,50 @@ UNKNOWN_STATUS_ERROR = ('API возвратило недокументирова
                         'работы или работу без статуса!')
 SEND_MESSAGE_ERROR = 'Ошибка при отправке сообщения в Telegram!'
 SUCCESS_SENT_MESSAGE = 'Бот успешно отправил сообщение в Telegram!'
+FLOOD_CONTROL_MESSAGE = ('Telegram ограничил частоту отправки сообщений, '
+                         'повтор через {} с.')
 DECODE_ERROR = 'Ошибка преобразования к типу данных Python!'
 HW_HAVE_NO_STATUS = 'Домашнему заданию еще не присвоен статус!'
+STATUS_CHANGED_MESSAGE = 'Изменился статус проверки работы "{}". {}'
+
+_MISSING = object()
 
 
 def check_tokens() -> None:
     """Проверка доступности переменных окружения."""
-    empty_tokens = {}
-    for token in ['PRACTICUM_TOKEN', 'TELEGRAM_TOKEN', 'TELEGRAM_CHAT_ID']:
-        if globals().get(token) is None:
-            empty_tokens[token] = None
-    if len(empty_tokens) != 0:
+    tokens = (
+        ('PRACTICUM_TOKEN', PRACTICUM_TOKEN),
+        ('TELEGRAM_TOKEN', TELEGRAM_TOKEN),
+        ('TELEGRAM_CHAT_ID', TELEGRAM_CHAT_ID),
+    )
+    empty_tokens = [name for name, value in tokens if not value]
+    if empty_tokens:
         logger.critical(f'{NO_TOKEN_ERROR}. {empty_tokens}')
         sys.exit(NO_TOKEN_ERROR)
 
 
-def get_api_answer(timestamp: int) -> dict:
+def get_api_answer(timestamp: int) -> Dict[str, Any]:
     """Возвращает словарь со всеми домашними работами."""
     try:
         homework_response = requests.get(
             ENDPOINT,
             headers=HEADERS,
-            params={'from_date': timestamp}
+            params={'from_date': timestamp},
+            timeout=REQUEST_TIMEOUT
         )
-        if homework_response.status_code != HTTPStatus.OK:
-            logger.error(UNAVAILABLE_ENDPIONT_ERROR)
-            raise NoConnectionToAPIError(UNAVAILABLE_ENDPIONT_ERROR)
-        else:
-            try:
-                return homework_response.json()
-            except json.JSONDecodeError:
-                raise JsonDecodeError(DECODE_ERROR)
-            finally:
-                logger.info(AVAILABLE_ENDPOINT_MESSAGE)
     except requests.exceptions.RequestException as err:
-        logger.error(f'{UNAVAILABLE_ENDPIONT_ERROR}. Ошибка: {err}')
+        raise NoConnectionToAPIError(UNAVAILABLE_ENDPIONT_ERROR) from err
+    if homework_response.status_code != HTTPStatus.OK:
+        raise NoConnectionToAPIError(UNAVAILABLE_ENDPIONT_ERROR)
+    try:
+        api_answer = homework_response.json()
+    except json.JSONDecodeError as err:
+        raise JsonDecodeError(DECODE_ERROR) from err
+    logger.debug(AVAILABLE_ENDPOINT_MESSAGE)
+    return api_answer
 
 
-def check_response(response: dict) -> None:
+def check_response(response: Dict[str, Any]) -> None:
     """Проверка ответа API на соответствие документации."""
     if not isinstance(response, dict):
         raise TypeError(WRONG_RESPONSE_ERROR)
@@ -104,22 +117,27 @@ def check_response(response: dict) -> None:
         raise TypeError(NO_LIST_ERROR)
 
 
-def parse_status(homework: dict) -> str:
+def parse_status(homework: Dict[str, Any]) -> str:
     """Возвращает сообщение со статусом домашней работы."""
-    homework_name = homework.get('homework_name')
-    homework_status = homework.get('status')
-    if homework_status not in HOMEWORK_VERDICTS:
+    verdict = HOMEWORK_VERDICTS.get(homework.get('status'), _MISSING)
+    if verdict is _MISSING:
         raise HwHaveNoStatusError(UNKNOWN_STATUS_ERROR)
-    if 'homework_name' not in homework:
-        raise HwHaveNoNameError(NO_KEY_ERROR)
-    verdict = HOMEWORK_VERDICTS.get(homework_status)
-    return f'Изменился статус проверки работы "{homework_name}". {verdict}'
+    try:
+        homework_name = homework['homework_name']
+    except KeyError:
+        raise HwHaveNoNameError(NO_KEY_ERROR) from None
+    return STATUS_CHANGED_MESSAGE.format(homework_name, verdict)
 
 
 def send_message(bot: telegram.Bot, message: str) -> None:
     """Отправка сообщения в Telegram."""
     try:
-        bot.send_message(TELEGRAM_CHAT_ID, message)
+        try:
+            bot.send_message(TELEGRAM_CHAT_ID, message)
+        except telegram.error.RetryAfter as err:
+            logger.warning(FLOOD_CONTROL_MESSAGE.format(err.retry_after))
+            time.sleep(err.retry_after)
+            bot.send_message(TELEGRAM_CHAT_ID, message)
     except telegram.TelegramError:
         logger.error(SEND_MESSAGE_ERROR)
         raise SendMessageError(SEND_MESSAGE_ERROR)
@@ -129,30 +147,49 @@ def send_message(bot: telegram.Bot, message: str) -> None:
 
 def main():
     """Основная логика работы бота."""
-    check_tokens()
-    bot = telegram.Bot(token=TELEGRAM_TOKEN)
-    timestamp = int(time.time())
-    latest_hw_status = None
-    while True:
-        try:
-            api_answer = get_api_answer(timestamp)
-            check_response(api_answer)
-            if len(api_answer.get('homeworks', HW_HAVE_NO_STATUS)) == 0:
-                logger.warning(HW_HAVE_NO_STATUS)
-                time.sleep(0)  # pytest не проходит без этой строки
-            else:
-                previous_hw_status = parse_status(
-                    api_answer.get('homeworks')[0]
-                )
-                if previous_hw_status != latest_hw_status:
-                    latest_hw_status = previous_hw_status
-                    send_message(bot, previous_hw_status)
-        except Exception as error:
-            message = f'Сбой в работе программы: {error}'
-            logger.error(message)
-            send_message(bot, message)
-        finally:
-            time.sleep(RETRY_PERIOD)
+    logger.addHandler(queue_handler)
+    log_listener.start()
+    try:
+        check_tokens()
+        bot = telegram.Bot(token=TELEGRAM_TOKEN)
+        timestamp = int(time.time())
+        latest_hw_status = None
+        last_error_message = None
+        retry_period = RETRY_PERIOD
+        while True:
+            try:
+                api_answer = get_api_answer(timestamp)
+                check_response(api_answer)
+                homeworks = api_answer['homeworks']
+                if not homeworks:
+                    logger.warning(HW_HAVE_NO_STATUS)
+                else:
+                    previous_hw_status = parse_status(homeworks[0])
+                    if previous_hw_status != latest_hw_status:
+                        latest_hw_status = previous_hw_status
+                        send_message(bot, previous_hw_status)
+                timestamp = api_answer.get('current_date', timestamp)
+                last_error_message = None
+                retry_period = RETRY_PERIOD
+            except SendMessageError:
+                retry_period = RETRY_PERIOD
+            except Exception as error:
+                message = f'Сбой в работе программы: {error}'
+                logger.error(message, exc_info=True)
+                if message != last_error_message:
+                    last_error_message = message
+                    send_message(bot, message)
+                if isinstance(
+                    error, (NoConnectionToAPIError, JsonDecodeError)
+                ):
+                    retry_period = min(retry_period * 2, MAX_RETRY_PERIOD)
+                else:
+                    retry_period = RETRY_PERIOD
+            finally:
+                time.sleep(retry_period)
+    finally:
+        log_listener.stop()
+        logger.removeHandler(queue_handler)
 
 
 if __name__ == '__main__':
@@ -509,6 +509,45 @@ class TestHomework:
             except Exception:
                 pass
 
+    def test_send_message_retry_after(self, monkeypatch, random_message,
+                                      homework_module):
+        bot = get_mock_telegram_bot(monkeypatch, random_message)
+        sleeps = []
+        sent_messages = []
+
+        def send_message_with_flood_control(chat_id=None, text=None,
+                                            **kwargs):
+            sent_messages.append(text)
+            if len(sent_messages) == 1:
+                raise telegram.error.RetryAfter(3)
+
+        monkeypatch.setattr(bot, 'send_message',
+                            send_message_with_flood_control)
+        monkeypatch.setattr(time, 'sleep', sleeps.append)
+
+        homework_module.send_message(bot, 'Test_message_check')
+        assert sleeps == [3], (
+            'Убедитесь, что при `RetryAfter` бот ждёт указанное Telegram '
+            'время перед повторной отправкой.'
+        )
+        assert sent_messages == ['Test_message_check'] * 2, (
+            'Убедитесь, что после `RetryAfter` сообщение отправляется '
+            'повторно.'
+        )
+
+        def send_message_always_flooded(chat_id=None, text=None, **kwargs):
+            sent_messages.append(text)
+            raise telegram.error.RetryAfter(3)
+
+        sent_messages.clear()
+        monkeypatch.setattr(bot, 'send_message', send_message_always_flooded)
+        with pytest.raises(homework_module.SendMessageError):
+            homework_module.send_message(bot, 'Test_message_check')
+        assert len(sent_messages) == 2, (
+            'Убедитесь, что при повторном `RetryAfter` бот не пытается '
+            'отправить сообщение бесконечно.'
+        )
+
     def test_bot_initialized_in_main(self, homework_module):
         func_name = 'main'
         utils.check_function(
@@ -753,6 +792,171 @@ class TestHomework:
                     'из переменной `HOMEWORK_VERDICTS`.'
                 )
 
+    def run_main(self, monkeypatch, homework_module, cycles):
+        """
+        Run main() for `cycles` polling cycles with a recording bot.
+
+        Returns the arguments passed to time.sleep() and the texts sent
+        by the bot.
+        """
+        homework_module.PRACTICUM_TOKEN = 'sometoken'
+        homework_module.TELEGRAM_TOKEN = '1234:abcdefg'
+        homework_module.TELEGRAM_CHAT_ID = '12345'
+        sleeps = []
+        sent_messages = []
+
+        def record_sleep(secs):
+            sleeps.append(secs)
+            if len(sleeps) == cycles:
+                raise utils.BreakInfiniteLoop('break')
+
+        bot = utils.MockTelegramBot()
+
+        def record_send_message(chat_id=None, text=None, **kwargs):
+            sent_messages.append(text)
+
+        monkeypatch.setattr(bot, 'send_message', record_send_message)
+        monkeypatch.setattr(telegram, 'Bot', lambda *args, **kwargs: bot)
+        monkeypatch.setattr(time, 'sleep', record_sleep)
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+        return sleeps, sent_messages
+
+    def run_main_with_api_answers(self, monkeypatch, homework_module,
+                                  api_answers):
+        """
+        Run main() on scripted get_api_answer results until they run out.
+
+        Each item of `api_answers` is either a dict returned by
+        get_api_answer or an exception raised from it.
+        """
+        api_answers = list(api_answers)
+
+        def mock_get_api_answer(timestamp):
+            answer = api_answers.pop(0)
+            if isinstance(answer, Exception):
+                raise answer
+            return answer
+
+        monkeypatch.setattr(
+            homework_module, 'get_api_answer', mock_get_api_answer
+        )
+        return self.run_main(monkeypatch, homework_module, len(api_answers))
+
+    def test_main_backoff_on_errors(self, monkeypatch, homework_module):
+        error = homework_module.NoConnectionToAPIError('API недоступно')
+        empty_answer = {'homeworks': [], 'current_date': 123246}
+        sleeps, sent_messages = self.run_main_with_api_answers(
+            monkeypatch, homework_module, [error] * 4 + [empty_answer, error]
+        )
+        assert sleeps[:4] == [1200, 2400, 3600, 3600], (
+            'Убедитесь, что при повторяющихся ошибках интервал опроса '
+            'удваивается, но не превышает `MAX_RETRY_PERIOD`.'
+        )
+        assert sleeps[4] == self.RETRY_PERIOD, (
+            'Убедитесь, что после успешного запроса интервал опроса '
+            'возвращается к `RETRY_PERIOD`.'
+        )
+        assert sleeps[5] == 1200, (
+            'Убедитесь, что после восстановления интервал опроса снова '
+            'удваивается начиная с `RETRY_PERIOD`.'
+        )
+        error_message = f'Сбой в работе программы: {error}'
+        assert sent_messages == [error_message, error_message], (
+            'Убедитесь, что одна и та же ошибка отправляется в Telegram '
+            'только один раз подряд и снова отправляется после успешного '
+            'запроса к API.'
+        )
+
+    def test_main_no_backoff_on_other_errors(self, monkeypatch,
+                                             homework_module):
+        api_error = homework_module.NoConnectionToAPIError('API недоступно')
+        status_error = homework_module.HwHaveNoStatusError('Нет статуса')
+        sleeps, _ = self.run_main_with_api_answers(
+            monkeypatch, homework_module, [api_error, status_error]
+        )
+        assert sleeps == [1200, self.RETRY_PERIOD], (
+            'Убедитесь, что интервал опроса увеличивается только при '
+            'ошибках обращения к API, а при остальных ошибках равен '
+            '`RETRY_PERIOD`.'
+        )
+
+    def test_main_connection_errors_sent_once(self, monkeypatch,
+                                              homework_module):
+        errors = [
+            requests.ConnectionError('connection object at 0x7efdab53d810'),
+            requests.ConnectionError('connection object at 0x7efdab53e2d0'),
+        ]
+
+        def mock_request_get_with_exception(*args, **kwargs):
+            raise errors.pop(0)
+
+        monkeypatch.setattr(requests, 'get', mock_request_get_with_exception)
+        _, sent_messages = self.run_main(monkeypatch, homework_module, 2)
+        assert len(sent_messages) == 1, (
+            'Убедитесь, что повторяющиеся ошибки соединения с API '
+            'отправляются в Telegram только один раз, даже если текст '
+            'исходного исключения различается.'
+        )
+
+    def test_main_send_message_error_not_reported(self, monkeypatch,
+                                                  homework_module):
+        send_error = homework_module.SendMessageError('Telegram недоступен')
+        sleeps, sent_messages = self.run_main_with_api_answers(
+            monkeypatch, homework_module, [send_error]
+        )
+        assert sent_messages == [], (
+            'Убедитесь, что ошибка отправки в Telegram не пересылается '
+            'в Telegram повторно.'
+        )
+        assert sleeps == [self.RETRY_PERIOD], (
+            'Убедитесь, что ошибка отправки в Telegram не увеличивает '
+            'интервал опроса API.'
+        )
+
+    def test_main_advances_from_date(self, monkeypatch, homework_module):
+        homework_module.PRACTICUM_TOKEN = 'sometoken'
+        homework_module.TELEGRAM_TOKEN = '1234:abcdefg'
+        homework_module.TELEGRAM_CHAT_ID = '12345'
+        api_answers = [
+            {'homeworks': [], 'current_date': 1000198000},
+            {
+                'homeworks': [
+                    {'homework_name': 'hw123', 'status': 'unknown'}
+                ],
+                'current_date': 1000198500
+            },
+            {'homeworks': [], 'current_date': 1000198991},
+        ]
+        from_dates = []
+
+        def mock_response_get(*args, **kwargs):
+            from_dates.append(kwargs['params']['from_date'])
+            response = utils.MockResponseGET(*args, **kwargs)
+            answer = api_answers[len(from_dates) - 1]
+            response.json = lambda: answer
+            return response
+
+        def sleep_to_interrupt(secs):
+            if len(from_dates) == len(api_answers):
+                raise utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr(time, 'sleep', sleep_to_interrupt)
+        monkeypatch.setattr(
+            telegram, 'Bot', lambda *args, **kwargs: utils.MockTelegramBot()
+        )
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+        assert from_dates[1] == api_answers[0]['current_date'], (
+            'Убедитесь, что следующий запрос к API передаёт в `from_date` '
+            'значение `current_date` из предыдущего ответа.'
+        )
+        assert from_dates[2] == from_dates[1], (
+            'Убедитесь, что `from_date` не меняется, если обработка '
+            'ответа API завершилась ошибкой.'
+        )
+
     def test_docstrings(self, homework_module):
         for func in self.HOMEWORK_FUNC_WITH_PARAMS_QTY:
             utils.check_docstring(homework_module, func)